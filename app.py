@@ -1,18 +1,39 @@
 import streamlit as st
 import pandas as pd
+import numpy as np
 from sklearn.feature_extraction.text import TfidfVectorizer
-from sklearn.metrics.pairwise import cosine_similarity
 import sqlite3
 import os
+import re
+import html
+import threading
+import tempfile
+from collections import Counter
+
+# Optional GPU acceleration: CuPy is only used when it is installed and a CUDA device is present
+try:
+    import cupy as cp
+    import cupyx.scipy.sparse as cpx
+    HAS_GPU = cp.cuda.runtime.getDeviceCount() > 0
+except Exception:
+    HAS_GPU = False
+
+# Below this many courses, host/device transfers cost more than the GPU saves
+GPU_MIN_COURSES = 50_000
 
 # --- Database Operations Logic ---
 # Initialize database for storing user data
+@st.cache_resource # Keep one connection for the whole process instead of reconnecting on every rerun
 def init_db():
-    conn = sqlite3.connect('users_data.db') 
-    c = conn.cursor()
+    # check_same_thread=False lets Streamlit's script threads share the cached connection
+    conn = sqlite3.connect('users_data.db', check_same_thread=False)
+    conn.execute('PRAGMA journal_mode=WAL')
+    conn.execute('PRAGMA synchronous=NORMAL')
+    conn.execute('PRAGMA temp_store=MEMORY')
+    conn.execute('PRAGMA cache_size=-20000')
 
     # Create users table if it does not exist
-    c.execute('''
+    conn.execute('''
         CREATE TABLE IF NOT EXISTS users (
             user_id INTEGER PRIMARY KEY AUTOINCREMENT,
             username TEXT UNIQUE,
@@ -22,7 +43,7 @@ def init_db():
         )
     ''')
     # Create progress table if it does not exist
-    c.execute('''
+    conn.execute('''
         CREATE TABLE IF NOT EXISTS progress (
             progress_id INTEGER PRIMARY KEY AUTOINCREMENT,
             user_id INTEGER,
@@ -31,63 +52,139 @@ def init_db():
             FOREIGN KEY (user_id) REFERENCES users (user_id)
         )
     ''')
+    # Index progress lookups by user; users.username is already covered by its UNIQUE index
+    conn.execute('CREATE INDEX IF NOT EXISTS idx_progress_user ON progress (user_id)')
     conn.commit()
     return conn
 
+@st.cache_resource # One lock per process, shared like the connection it guards
+def get_db_lock():
+    # Serializes writes so one session's commit cannot interleave with another session's statement
+    return threading.Lock()
+
 # Function to add a new user
 def add_user(conn, username, interests, goals, skill_level):
-    c = conn.cursor()
-    try:
-        c.execute("INSERT INTO users (username, interests, goals, skill_level) VALUES (?, ?, ?, ?)",
-                  (username, interests, goals, skill_level))
-        conn.commit()
-        st.success(f"User '{username}' registered successfully!")
-        return c.lastrowid
-    except sqlite3.IntegrityError:
-        st.error(f"Username '{username}' already exists. Please choose a different username.")
-        return None
+    with get_db_lock():
+        try:
+            c = conn.execute("INSERT INTO users (username, interests, goals, skill_level) VALUES (?, ?, ?, ?)",
+                             (username, interests, goals, skill_level))
+            conn.commit()
+        except sqlite3.IntegrityError:
+            # Release the write transaction so the shared connection does not keep holding the lock
+            conn.rollback()
+            st.error(f"Username '{username}' already exists. Please choose a different username.")
+            return None
+    st.success(f"User '{username}' registered successfully!")
+    return c.lastrowid
 
 # Function to get user by username
 def get_user(conn, username):
-    c = conn.cursor()
-    c.execute("SELECT * FROM users WHERE username = ?", (username,))
-    return c.fetchone()
+    return conn.execute("SELECT * FROM users WHERE username = ?", (username,)).fetchone()
 
 # Function to update user progress
 def update_progress(conn, user_id, course_id, completion_status):
-    c = conn.cursor()
-    c.execute("INSERT OR REPLACE INTO progress (user_id, course_id, completion_status) VALUES (?, ?, ?)",
-              (user_id, course_id, completion_status))
-    conn.commit()
+    with get_db_lock():
+        conn.execute("INSERT OR REPLACE INTO progress (user_id, course_id, completion_status) VALUES (?, ?, ?)",
+                     (user_id, course_id, completion_status))
+        conn.commit()
     st.success(f"Progress for {course_id} updated to {completion_status*100:.0f}%!")
 
+# Function to update progress for several courses in a single transaction
+def update_progress_many(conn, user_id, rows):
+    # rows is an iterable of (course_id, completion_status) pairs
+    with get_db_lock(), conn:
+        c = conn.executemany("INSERT OR REPLACE INTO progress (user_id, course_id, completion_status) VALUES (?, ?, ?)",
+                             ((user_id, course_id, completion_status) for course_id, completion_status in rows))
+    st.success(f"Progress updated for {c.rowcount} course(s)!")
+
 # Function to get user's progress
 def get_user_progress(conn, user_id):
-    c = conn.cursor()
-    c.execute("SELECT course_id, completion_status FROM progress WHERE user_id = ?", (user_id,))
-    return c.fetchall()
+    return conn.execute("SELECT course_id, completion_status FROM progress WHERE user_id = ?", (user_id,)).fetchall()
 
 # --- Data Loading and Preprocessing ---
-@st.cache_data  # Cache data to improve performance
-def load_course_data(file_path='final_plae_recommendation_data.csv.csv'):
+COURSE_CSV_PATH = 'final_plae_recommendation_data.csv.csv'
+COURSE_PARQUET_PATH = 'final_plae_recommendation_data.parquet'
+# Only the columns used downstream are read from the Parquet file
+COURSE_COLUMNS = ['course_id', 'title', 'Category', 'skills_covered', 'prerequisites', 'difficulty_level',
+                  'youtube_links', 'Research_papers', 'Related_articles', 'text_books', 'Github_repository']
+
+# The Parquet file is stale when it is missing or older than the source CSV
+def course_data_is_stale(csv_path=COURSE_CSV_PATH, parquet_path=COURSE_PARQUET_PATH):
+    if not os.path.exists(parquet_path):
+        return True
+    return os.path.exists(csv_path) and os.path.getmtime(csv_path) > os.path.getmtime(parquet_path)
+
+# Convert the source CSV into a typed, columnar Parquet file and return the data read from the CSV
+def convert_course_data(csv_path=COURSE_CSV_PATH, parquet_path=COURSE_PARQUET_PATH):
+    # Using latin1 encoding as it resolved previous UnicodeDecodeError
+    df = pd.read_csv(csv_path, encoding='latin1')
+    tmp_path = None
+    try:
+        # Write to a temp file in the same directory and swap it in atomically, so a crash or a
+        # concurrent reader never sees a half-written Parquet file at parquet_path
+        parquet_dir = os.path.dirname(os.path.abspath(parquet_path))
+        fd, tmp_path = tempfile.mkstemp(prefix=os.path.basename(parquet_path) + '.', suffix='.tmp', dir=parquet_dir)
+        os.close(fd)
+        os.chmod(tmp_path, 0o644)
+        df.to_parquet(tmp_path, engine='pyarrow', index=False)
+        os.replace(tmp_path, parquet_path)
+    except Exception:
+        # Read-only directory or a column pyarrow cannot serialize: keep serving the CSV data
+        if tmp_path is not None:
+            try:
+                os.remove(tmp_path)
+            except OSError:
+                pass
+    return df[COURSE_COLUMNS].copy()
+
+# Lightweight cache key for the course data and everything derived from it
+# Hashing this 2-tuple is far cheaper than letting Streamlit hash the whole dataframe on every rerun
+def get_data_key(csv_path=COURSE_CSV_PATH, file_path=COURSE_PARQUET_PATH):
+    # Key on the source CSV, which the Parquet file is regenerated from; fall back to the Parquet
+    # file for deployments that ship only that, and to None so a missing dataset is reported on load
+    for path in (csv_path, file_path):
+        try:
+            return os.path.getmtime(path), os.path.getsize(path)
+        except OSError:
+            continue
+    return None
+
+@st.cache_data  # Cache data to improve performance; data_key invalidates the cache when the source changes
+def load_course_data(data_key, file_path=COURSE_PARQUET_PATH, csv_path=COURSE_CSV_PATH):
     try:
-        # Using latin1 encoding as it resolved previous UnicodeDecodeError
-        df = pd.read_csv(file_path, encoding='latin1')
+        df = None
+        if not course_data_is_stale(csv_path, file_path):
+            try:
+                df = pd.read_parquet(file_path, columns=COURSE_COLUMNS)
+            except Exception:
+                # Truncated or corrupt Parquet file: rebuild it from the source CSV below
+                df = None
+        if df is None:
+            df = convert_course_data(csv_path, file_path)
 
         # Remove trailing empty rows and drop rows with essential nulls
         # Removed 'Domain' from subset as it's not present in the provided CSV snippet
         df.dropna(how='all', inplace=True)
         df.dropna(subset=['course_id', 'title', 'Category', 'skills_covered', 'prerequisites'], inplace=True)
 
+        # Categorical dtype: filtering and unique() work on integer codes instead of Python strings
+        df['Category'] = df['Category'].astype('category')
+        df['difficulty_level'] = df['difficulty_level'].astype('category')
+
+        # Normalize free-text columns once so downstream code never sees NaN
+        text_cols = ['title', 'skills_covered', 'prerequisites', 'Research_papers', 'Related_articles', 'text_books', 'Github_repository']
+        df[text_cols] = df[text_cols].fillna('').astype('string')
+
         # Combine relevant features for content-based filtering
         # Removed 'Domain' from features as it's not present
-        df['features'] = df.apply(
-            lambda x: f"{x['title']} {x['Category']} {x['skills_covered']} {x['prerequisites']}",
-            axis=1
+        # Vectorized string concat instead of a per-row apply
+        df['features'] = df['title'].str.cat(
+            [df['Category'].astype('string'), df['skills_covered'], df['prerequisites']],
+            sep=' '
         )
         return df
-    except FileNotFoundError:
-        st.error(f"Error: The file '{file_path}' was not found. Please ensure the file exists in the correct directory.")
+    except FileNotFoundError as e:
+        st.error(f"Error: The file '{e.filename or file_path}' was not found. Please ensure the file exists in the correct directory.")
         return None
     except Exception as e:
         st.error(f"Error loading dataset: {str(e)}")
@@ -95,36 +192,151 @@ def load_course_data(file_path='final_plae_recommendation_data.csv.csv'):
 
 # --- Recommendation Engine Logic ---
 @st.cache_resource # Cache resource (TF-IDF model and matrix) for efficient reuse
-def get_tfidf_matrix(dataframe):
-    tfidf = TfidfVectorizer(stop_words='english')
-    tfidf_matrix = tfidf.fit_transform(dataframe['features'])
+def get_tfidf_matrix(data_key):
+    dataframe = load_course_data(data_key)
+    # norm='l2' makes every row unit-length, so a plain dot product is the cosine similarity
+    # float32 halves the bytes scanned per query; CSR keeps category row slicing cheap
+    tfidf = TfidfVectorizer(stop_words='english', norm='l2', dtype=np.float32)
+    tfidf_matrix = tfidf.fit_transform(dataframe['features']).tocsr()
+    # Sorted, 32-bit column indices let the per-query mat-vec stream sequentially through smaller arrays
+    tfidf_matrix.sort_indices()
+    if tfidf_matrix.nnz <= np.iinfo(np.int32).max:
+        tfidf_matrix.indptr = tfidf_matrix.indptr.astype(np.int32, copy=False)
+        tfidf_matrix.indices = tfidf_matrix.indices.astype(np.int32, copy=False)
+    # Keep large catalogs resident on the GPU so each query's mat-vec runs there
+    if HAS_GPU and tfidf_matrix.shape[0] >= GPU_MIN_COURSES:
+        tfidf_matrix = cpx.csr_matrix(tfidf_matrix)
     return tfidf, tfidf_matrix
 
+@st.cache_resource # Cache the fitted vocabulary pieces needed to vectorize queries by hand
+def get_query_vectorizer(data_key):
+    tfidf, _ = get_tfidf_matrix(data_key)
+    # Stop words never make it into the fitted vocabulary, so the vocabulary lookup also filters them
+    return re.compile(tfidf.token_pattern), tfidf.vocabulary_, tfidf.idf_.astype(np.float32)
+
+# Build the L2-normalized TF-IDF vector of a query directly from the cached vocabulary and IDF,
+# skipping the general-purpose TfidfVectorizer.transform pipeline on the query path
+def vectorize_query(user_input, query_vectorizer):
+    token_pattern, vocabulary, idf = query_vectorizer
+    counts = Counter(vocabulary[token] for token in token_pattern.findall(user_input.lower()) if token in vocabulary)
+
+    user_vector = np.zeros(idf.shape[0], dtype=np.float32)
+    if counts:
+        indices = np.fromiter(counts.keys(), dtype=np.intp, count=len(counts))
+        user_vector[indices] = np.fromiter(counts.values(), dtype=np.float32, count=len(counts)) * idf[indices]
+        user_vector /= np.linalg.norm(user_vector)
+    return user_vector
+
+@st.cache_data # Cache category -> row positions so filtering can slice the global TF-IDF matrix
+def get_category_rows(data_key):
+    dataframe = load_course_data(data_key)
+    # groupby().indices yields positional row indices, matching the rows of the TF-IDF matrix
+    return {category: np.asarray(rows) for category, rows in dataframe.groupby('Category', observed=True).indices.items()}
+
+@st.cache_data # Cache selectbox options so they are not rebuilt on every rerun
+def get_category_options(data_key):
+    dataframe = load_course_data(data_key)
+    # Categories of a categorical column are already unique and sorted
+    return ['All'] + dataframe['Category'].cat.categories.tolist()
+
+@st.cache_data # Cache selectbox options so they are not rebuilt on every rerun
+def get_course_id_options(data_key):
+    dataframe = load_course_data(data_key)
+    return ['Select a Course'] + dataframe['course_id'].unique().tolist()
+
+# Indices of the top_n highest scores, ordered exactly like a stable descending sort:
+# ties (including the zero-score filler when few courses match) are broken by catalog order
+def top_score_indices(scores, top_n):
+    # Ensure we don't try to get more recommendations than available courses
+    top_n = min(top_n, scores.shape[0])
+    if top_n <= 0:
+        return np.empty(0, dtype=np.intp)
+
+    # Partial top-k selection finds the cut-off score without sorting every course
+    top_indices = np.argpartition(-scores, top_n - 1)[:top_n]
+    kth = scores[top_indices].min()
+    # argpartition picks arbitrarily among courses tied at the cut-off, so take the earliest rows instead
+    above = np.flatnonzero(scores > kth)
+    tied = np.flatnonzero(scores == kth)[:top_n - above.shape[0]]
+    top_indices = np.concatenate([above, tied])
+
+    # Restore catalog order first so the stable sort breaks score ties by row, as the full sort did
+    top_indices.sort()
+    return top_indices[np.argsort(-scores[top_indices], kind='stable')]
+
 # Function to recommend courses based on user input
-def recommend_courses(user_input, tfidf_model, tfidf_matrix, dataframe, top_n=5):
+def recommend_courses(user_input, query_vectorizer, tfidf_matrix, dataframe, top_n=5):
     if not user_input or dataframe.empty:
         return pd.DataFrame() # Return empty if no input or dataframe is empty
 
-    user_tfidf = tfidf_model.transform([user_input])
-    cosine_sim = cosine_similarity(user_tfidf, tfidf_matrix)
+    # Query and matrix rows are both L2-normalized, so one sparse mat-vec yields the cosine scores
+    user_vector = vectorize_query(user_input, query_vectorizer)
+    if HAS_GPU and cpx.issparse(tfidf_matrix):
+        # Only the query vector goes to the device; only the scores come back
+        scores = (tfidf_matrix @ cp.asarray(user_vector)).get()
+    else:
+        scores = tfidf_matrix @ user_vector
 
-    sim_scores = list(enumerate(cosine_sim[0]))
-    sim_scores = sorted(sim_scores, key=lambda x: x[1], reverse=True)
-
-    # Ensure we don't try to get more recommendations than available courses
-    top_n = min(top_n, len(sim_scores))
-    course_indices = [i[0] for i in sim_scores[0:top_n]]
+    course_indices = top_score_indices(scores, top_n)
 
     # Return all relevant features from the dataframe for display
     # Added 'Research_papers', 'Related_articles', 'text_books', and 'Github_repository'
     return dataframe.iloc[course_indices][['course_id', 'title', 'Category', 'difficulty_level', 'skills_covered', 'prerequisites', 'youtube_links', 'Research_papers', 'Related_articles', 'text_books', 'Github_repository']]
 
-# --- Streamlit Application ---
-def main():
-    st.set_page_config(page_title="AcademIQ - Personalized Learning", layout="wide")
-
-    # Custom styling for the sidebar and main content
-    st.markdown("""
+# Function to render recommendations as one markdown block instead of one element per field
+def render_recommendations(recommendations):
+    # Precompute which optional resources are present, vectorized over all results
+    recommendations = recommendations.assign(**{
+        f"{col}_ok": recommendations[col].str.strip().ne('')
+        for col in ('Research_papers', 'Related_articles', 'text_books', 'Github_repository')
+    })
+
+    # Dataset text is escaped because the whole block is rendered with unsafe_allow_html;
+    # only the title span itself is raw HTML
+    parts = []
+    for row in recommendations.itertuples(index=False):
+        parts.append(f"**<span style='color: #76ABAE; font-size: 20px;'>{html.escape(str(row.title))}</span>**")
+        parts.append(f"**Category:** {html.escape(str(row.Category))}")
+        parts.append(f"**Difficulty Level:** {html.escape(str(row.difficulty_level))}")
+        parts.append(f"**Skills Covered:** {html.escape(str(row.skills_covered))}")
+        parts.append(f"**Prerequisites:** {html.escape(str(row.prerequisites))}")
+        parts.append(f"**YouTube Link:** [Watch Video]({html.escape(str(row.youtube_links))})")
+
+        # Display Research Papers, Related Articles, Text Books, and Github Repository
+        if row.Research_papers_ok:
+            parts.append(f"**Research Papers:** {html.escape(str(row.Research_papers))}")
+        if row.Related_articles_ok:
+            parts.append(f"**Related Articles:** {html.escape(str(row.Related_articles))}")
+        if row.text_books_ok:
+            parts.append(f"**Text Books:** {html.escape(str(row.text_books))}")
+        if row.Github_repository_ok:
+            parts.append(f"**GitHub Repository:** [Link]({html.escape(str(row.Github_repository))})")
+
+        parts.append("---")
+    # Blank lines keep each field its own paragraph, as separate st.write calls did
+    return "\n\n".join(parts)
+
+# Bound the memo: queries are free-form text, so distinct inputs would otherwise accumulate forever
+@st.cache_data(max_entries=256, ttl=3600) # Repeated clicks with the same inputs reuse the rendered result
+def get_recommendations_markdown(user_input, selected_category, data_key):
+    dataframe = load_course_data(data_key)
+    _, tfidf_matrix = get_tfidf_matrix(data_key)
+
+    # Filter DataFrame and TF-IDF rows based on selected category
+    if selected_category != 'All':
+        category_rows = get_category_rows(data_key)[selected_category]
+        dataframe = dataframe.iloc[category_rows]
+        tfidf_matrix = tfidf_matrix[category_rows]
+
+    # Reuse the global TF-IDF vocabulary; the matrix rows are already sliced to the category
+    recommendations = recommend_courses(user_input, get_query_vectorizer(data_key), tfidf_matrix, dataframe)
+    if recommendations.empty:
+        return ""
+    return render_recommendations(recommendations)
+
+# --- Page Markup ---
+# Static HTML/CSS built once at import time and reused on every rerun
+APP_STYLE_HTML = """
         <link href="https://fonts.googleapis.com/css2?family=Poppins:wght@400;600&display=swap" rel="stylesheet">
         <style>
         html, body, [class*="st-emotion"] {
@@ -197,7 +409,21 @@ def main():
             box-shadow: 0 -2px 5px rgba(0,0,0,0.2);
         }
         </style>
-    """, unsafe_allow_html=True)
+    """
+
+FOOTER_HTML = """
+        <div class="footer">
+            <p>&copy; 2025 AcademIQ. All rights reserved.</p>
+            <p>Powered by Laizer</p>
+        </div>
+    """
+
+# --- Streamlit Application ---
+def main():
+    st.set_page_config(page_title="AcademIQ - Personalized Learning", layout="wide")
+
+    # Custom styling for the sidebar and main content
+    st.markdown(APP_STYLE_HTML, unsafe_allow_html=True)
 
     # Sidebar Logo and Name
     st.sidebar.markdown("""
@@ -213,13 +439,12 @@ def main():
     # Initializing database
     conn = init_db()
 
-    # Loading course data and TF-IDF matrix
-    df = load_course_data()
+    # Loading course data; the TF-IDF model and matrix are built lazily from the same cache key
+    data_key = get_data_key()
+    df = load_course_data(data_key)
     if df is None:
         st.stop()  # Stop execution if dataset fails to load
 
-    tfidf, tfidf_matrix = get_tfidf_matrix(df)
-
     if page == "Home":
         st.markdown("<h1 style='text-align: center; color: #76ABAE;'> AcademIQ 📚 </h1>", unsafe_allow_html=True)
         st.markdown("<h3 style='text-align: center; color: #eeeeee;'>Your Personalized Learning Recommendation Engine</h3>", unsafe_allow_html=True)
@@ -292,20 +517,14 @@ def main():
         st.title("Your Personalized Course Recommendations")
         st.write("Filter and get tailored course suggestions.")
 
-        # Get unique categories from the dataset
-        categories = ['All'] + sorted(df['Category'].unique().tolist())
-        selected_category = st.selectbox("Select Category", categories)
-
-        # Filter DataFrame based on selected category
-        final_filtered_df = df.copy()
-        if selected_category != 'All':
-            final_filtered_df = final_filtered_df[final_filtered_df['Category'] == selected_category]
+        selected_category = st.selectbox("Select Category", get_category_options(data_key))
 
         user_input_keywords = st.text_area("Further refine with keywords (e.g., machine learning, Python, finance)",
                                            help="Enter specific skills or topics to narrow down recommendations.")
 
         if st.button("Get Recommendations"):
-            if not final_filtered_df.empty:
+            # Categories come from the dataset itself, so a selected category is empty only if the dataset is
+            if not df.empty:
                 # Prepare combined input for recommendation engine
                 combined_input_for_recommendation = ""
                 if selected_category != 'All':
@@ -317,33 +536,12 @@ def main():
                     return
 
                 try:
-                    # Re-fit TF-IDF on the final filtered data for relevant recommendations
-                    filtered_tfidf = TfidfVectorizer(stop_words='english')
-                    filtered_tfidf_matrix = filtered_tfidf.fit_transform(final_filtered_df['features'])
+                    recommendations_markdown = get_recommendations_markdown(combined_input_for_recommendation, selected_category, data_key)
 
-                    recommendations = recommend_courses(combined_input_for_recommendation, filtered_tfidf, filtered_tfidf_matrix, final_filtered_df)
-
-                    if not recommendations.empty:
+                    if recommendations_markdown:
                         st.subheader("Recommended Courses")
-                        for index, row in recommendations.iterrows():
-                            st.markdown(f"**<span style='color: #76ABAE; font-size: 20px;'>{row['title']}</span>**", unsafe_allow_html=True)
-                            st.write(f"**Category:** {row['Category']}")
-                            st.write(f"**Difficulty Level:** {row['difficulty_level']}")
-                            st.write(f"**Skills Covered:** {row['skills_covered']}")
-                            st.write(f"**Prerequisites:** {row['prerequisites']}")
-                            st.write(f"**YouTube Link:** [Watch Video]({row['youtube_links']})")
-                            
-                            # Display Research Papers, Related Articles, Text Books, and Github Repository
-                            if pd.notna(row['Research_papers']) and row['Research_papers'].strip():
-                                st.write(f"**Research Papers:** {row['Research_papers']}")
-                            if pd.notna(row['Related_articles']) and row['Related_articles'].strip():
-                                st.write(f"**Related Articles:** {row['Related_articles']}")
-                            if pd.notna(row['text_books']) and row['text_books'].strip():
-                                st.write(f"**Text Books:** {row['text_books']}")
-                            if pd.notna(row['Github_repository']) and row['Github_repository'].strip():
-                                st.write(f"**GitHub Repository:** [Link]({row['Github_repository']})")
-                            
-                            st.markdown("---")
+                        # Send all results to the frontend in a single markdown element
+                        st.markdown(recommendations_markdown, unsafe_allow_html=True)
                     else:
                         st.warning("No recommendations found for your selection and keywords. Try different criteria.")
                 except ValueError as ve:
@@ -375,7 +573,7 @@ def main():
             # Allow updating progress
             st.subheader("Update Course Progress")
             # Ensure only courses from the loaded dataframe are available for selection
-            course_id_options = ['Select a Course'] + df['course_id'].unique().tolist()
+            course_id_options = get_course_id_options(data_key)
             course_id_to_update = st.selectbox("Select Course ID to update", course_id_options)
 
             if course_id_to_update != 'Select a Course':
@@ -389,12 +587,7 @@ def main():
             st.warning("Please go to the 'Profile' page and log in or register to track your progress.")
 
     # Footer
-    st.markdown("""
-        <div class="footer">
-            <p>&copy; 2025 AcademIQ. All rights reserved.</p>
-            <p>Powered by Laizer</p>
-        </div>
-    """, unsafe_allow_html=True)
+    st.markdown(FOOTER_HTML, unsafe_allow_html=True)
 
 if __name__ == "__main__":
     main()
@@ -0,0 +1,38 @@
+import numpy as np
+import pytest
+
+from app import top_score_indices
+
+
+# Reference ordering: the stable full sort recommend_courses used before top-k selection
+def sorted_top_indices(scores, top_n):
+    sim_scores = sorted(enumerate(scores), key=lambda x: x[1], reverse=True)
+    return [i[0] for i in sim_scores[0:top_n]]
+
+
+def sparse_match_scores(size, matches):
+    scores = np.zeros(size, dtype=np.float32)
+    for index, score in matches.items():
+        scores[index] = score
+    return scores
+
+
+@pytest.mark.parametrize("scores", [
+    # Fewer matches than top_n: the zero-score filler must come in catalog order
+    sparse_match_scores(70, {35: 0.4, 67: 0.2}),
+    sparse_match_scores(1000, {10: 0.3, 500: 0.3}),
+    # No matches at all
+    np.zeros(50, dtype=np.float32),
+    # Ties at the cut-off score
+    np.array([0.1, 0.5, 0.5, 0.2, 0.5, 0.2, 0.2, 0.0], dtype=np.float32),
+    # Random scores with many duplicates
+    np.random.default_rng(0).integers(0, 4, size=200).astype(np.float32),
+])
+@pytest.mark.parametrize("top_n", [1, 3, 5])
+def test_top_score_indices_matches_stable_sort(scores, top_n):
+    assert top_score_indices(scores, top_n).tolist() == sorted_top_indices(scores.tolist(), top_n)
+
+
+def test_top_score_indices_caps_at_catalog_size():
+    scores = np.array([0.2, 0.0, 0.7], dtype=np.float32)
+    assert top_score_indices(scores, 5).tolist() == [2, 0, 1]